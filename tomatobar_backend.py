@@ -6,18 +6,27 @@ and data persistence for the Tomatobar Timer.
 """
 
 import json
+import math
 import os
+import select
 import signal
+import socket
 import sqlite3
 import subprocess
 import sys
 import time
-from datetime import datetime
 from enum import Enum, auto
 from pathlib import Path
-import threading
 import logging
 
+# orjson is optional; fall back to compact stdlib JSON. Both return bytes.
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -34,21 +43,71 @@ class PomodoroState(Enum):
     LONG_BREAK = auto()
     PAUSED = auto()
 
+# State names as exposed in the status JSON
+STATE_MAP = {
+    PomodoroState.IDLE: "idle",
+    PomodoroState.WORK: "work",
+    PomodoroState.SHORT_BREAK: "short_break",
+    PomodoroState.LONG_BREAK: "long_break",
+    PomodoroState.PAUSED: "paused"
+}
+
 class PomodoroTimer:
     """Main Pomodoro Timer class handling timer logic and state transitions."""
+
+    INSERT_SESSION_SQL = '''
+    INSERT INTO sessions
+    (start_time, end_time, type, completed, duration_actual_seconds, pomodoro_count_at_completion)
+    VALUES (?, ?, ?, ?, ?, ?)
+    '''
+
+    # Delay before committing logged sessions, so bursts share a single commit
+    COMMIT_DELAY_SECONDS = 0.2
+
+    # Minimum spacing between status file writes; skipped writes are retried after it
+    STATUS_WRITE_MIN_INTERVAL = 0.05
     
     def __init__(self):
         """Initialize the Pomodoro Timer with default settings."""
         self.config = self._load_config()
+        
+        # Resolve phase settings once so the hot paths don't go through the config dict
+        self.work_seconds = self.config["work_duration_minutes"] * 60
+        self.short_break_seconds = self.config["short_break_duration_minutes"] * 60
+        self.long_break_seconds = self.config["long_break_duration_minutes"] * 60
+        self.long_break_every = self.config["pomodoros_before_long_break"]
+        
+        # Expand paths once; sounds that are unset or missing become None
+        self.db_path_expanded = os.path.expanduser(self.config["db_path"])
+        self.sound_work_end_expanded = self._resolve_sound(self.config["notification_sound_work_end"])
+        self.sound_break_end_expanded = self._resolve_sound(self.config["notification_sound_break_end"])
+        
         self.db_conn = self._setup_database()
+        self._commit_deadline = None
         
         # State variables
         self.current_state = PomodoroState.IDLE
-        self.time_remaining_seconds = 0
+        self.phase_deadline = None
+        self._next_status_refresh = None
         self.pomodoros_completed_in_cycle = 0
         self.session_start_timestamp = None
+        self._session_monotonic_start = None
         self.paused_time_remaining = 0
         self.running = True
+        self._last_status_payload = None
+        self._last_status_write = 0.0
+        self._status_write_deadline = None
+        
+        # Map FIFO commands to their handlers
+        self._command_handlers = {
+            "start": self._handle_start,
+            "pause": self._handle_pause,
+            "resume": self._handle_resume,
+            "skip": self._handle_skip,
+            "reset": self._reset,
+            "restart_cycle": self._restart_cycle,
+            "get_status": self._handle_get_status,
+        }
         
         # Create and setup FIFOs
         self._setup_fifos()
@@ -57,8 +116,20 @@ class PomodoroTimer:
         signal.signal(signal.SIGINT, self._handle_exit)
         signal.signal(signal.SIGTERM, self._handle_exit)
         
+        # Notification and sound helpers are never waited on; let the kernel reap them
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+        
         logger.info("Tomatobar Timer initialized")
 
+    @property
+    def time_remaining_seconds(self):
+        """Seconds left in the current phase, derived from the phase deadline."""
+        if self.current_state == PomodoroState.PAUSED:
+            return self.paused_time_remaining
+        if self.phase_deadline is None:
+            return 0
+        return max(0, math.ceil(self.phase_deadline - time.monotonic()))
+
     def _load_config(self):
         """
         Load configuration from the config file.
@@ -95,6 +166,7 @@ class PomodoroTimer:
                     "notification_sound_break_end": "",
                     "db_path": "~/.local/share/tomatobar/stats.db",
                     "status_file_path": "/tmp/tomatobar-status.json",
+                    "status_socket_path": "/tmp/tomatobar-status.sock",
                     "fifo_path_commands": "/tmp/tomatobar-commands"
                 }
                 
@@ -110,21 +182,42 @@ class PomodoroTimer:
             logger.error(f"Error loading config: {e}")
             sys.exit(1)
 
+    def _resolve_sound(self, sound_path):
+        """Expand a configured sound path, returning None if unset or missing."""
+        if not sound_path:
+            return None
+        sound_path = os.path.expanduser(sound_path)
+        if not os.path.exists(sound_path):
+            logger.warning(f"Sound file not found, sound disabled: {sound_path}")
+            return None
+        return sound_path
+
     def _setup_database(self):
         """
         Set up the SQLite database for storing Pomodoro sessions.
         Creates the database file and sessions table if they don't exist.
         """
-        db_path = os.path.expanduser(self.config["db_path"])
+        db_path = self.db_path_expanded
         db_dir = os.path.dirname(db_path)
         
         # Create the database directory if it doesn't exist
         os.makedirs(db_dir, exist_ok=True)
         
         try:
-            conn = sqlite3.connect(db_path)
+            # Autocommit mode: transactions are only opened explicitly in _log_session
+            conn = sqlite3.connect(db_path, isolation_level=None)
+
+            # Use WAL so each commit is a single append instead of a
+            # rollback-journal rewrite, and relax fsyncs to NORMAL
+            journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            if journal_mode.lower() != "wal":
+                logger.warning(f"Could not enable WAL mode, journal_mode is '{journal_mode}'")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=67108864")
+
             cursor = conn.cursor()
-            
+
             # Create the sessions table if it doesn't exist
             cursor.execute('''
             CREATE TABLE IF NOT EXISTS sessions (
@@ -137,8 +230,7 @@ class PomodoroTimer:
                 pomodoro_count_at_completion INTEGER
             )
             ''')
-            
-            conn.commit()
+
             logger.info(f"Database setup complete: {db_path}")
             return conn
         except Exception as e:
@@ -158,135 +250,229 @@ class PomodoroTimer:
             if not os.path.exists(self.fifo_path_commands):
                 os.mkfifo(self.fifo_path_commands, 0o600)
             
+            # Hold a write end open ourselves so the reader never sees EOF
+            # when a client closes, and never has to reopen the FIFO
+            self._fifo_keepalive = os.open(self.fifo_path_commands, os.O_RDWR | os.O_NONBLOCK)
+            
             logger.info("Command FIFO and status file path setup complete")
         except Exception as e:
             logger.error(f"Error setting up command FIFO: {e}")
             sys.exit(1)
         
-        # Start the command listener thread
-        threading.Thread(target=self._command_listener, daemon=True).start()
+        # Keep the status file open for the life of the process
+        try:
+            self._open_status_file()
+        except Exception as e:
+            logger.error(f"Error opening status file: {e}")
+            sys.exit(1)
+        
+        # Open the read end once; the keep-alive above means it never sees EOF
+        self._fifo_fd = os.open(self.fifo_path_commands, os.O_RDONLY | os.O_NONBLOCK)
+        self._command_buffer = bytearray()
+        
+        # Self-pipe used by the signal handler to wake the main loop
+        self._shutdown_r, self._shutdown_w = os.pipe()
+        
+        # Serve status over a datagram socket so the module doesn't have to read the file
+        self.status_socket_path = self.config.get("status_socket_path")
+        self.status_socket = None
+        if self.status_socket_path:
+            try:
+                if os.path.exists(self.status_socket_path):
+                    os.unlink(self.status_socket_path)
+                self.status_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                self.status_socket.bind(self.status_socket_path)
+                self.status_socket.setblocking(False)
+                logger.info(f"Status socket listening on {self.status_socket_path}")
+            except Exception as e:
+                logger.error(f"Error setting up status socket: {e}")
+                self.status_socket = None
+
+    def _open_status_file(self):
+        """(Re)open the status file, truncating it, and reset the cached write state."""
+        self._status_fd = os.open(self.status_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        self._status_file_size = 0
+        self._last_status_payload = None
+
+    def _ensure_status_file(self):
+        """Reopen the status file if its path was removed or replaced since we opened it."""
+        opened = os.fstat(self._status_fd)
+        try:
+            current = os.stat(self.status_file_path)
+            if (current.st_ino, current.st_dev) == (opened.st_ino, opened.st_dev):
+                return
+        except FileNotFoundError:
+            pass
+        logger.info(f"Status file {self.status_file_path} was removed or replaced, reopening")
+        os.close(self._status_fd)
+        self._open_status_file()
 
-    def _command_listener(self):
+    def _answer_status_request(self):
         """
-        Listen for commands from the command FIFO pipe.
-        This runs in a separate thread to avoid blocking the main loop.
+        Answer a pending request on the status socket.
+        Any datagram received is treated as a request; the reply is the status JSON.
         """
-        logger.info("Command listener started")
-        while self.running:
+        try:
+            _, address = self.status_socket.recvfrom(16)
+        except BlockingIOError:
+            return
+        if address:
             try:
-                # Open the FIFO in read mode (blocking)
-                with open(self.fifo_path_commands, 'r') as fifo:
-                    while self.running:
-                        raw_command = fifo.readline()
-                        if not raw_command and not self.running: # EOF and shutting down
-                            break
-                        logger.debug(f"Raw command read from FIFO: '{raw_command.encode('utf-8').hex()}' (len: {len(raw_command)})")
-                        command = raw_command.strip()
-                        if command:
-                            logger.info(f"Received command: {command}")
-                            self._process_command(command)
-                        elif raw_command: # Non-empty but stripped to empty (e.g. just newline)
-                            logger.debug(f"Command stripped to empty, was: '{raw_command.encode('utf-8').hex()}'")
-            except Exception as e:
-                logger.error(f"Error in command listener: {e}")
-                time.sleep(1)  # Wait a bit before trying again
+                self.status_socket.sendto(_dumps(self._build_status()), address)
+            except OSError as e:
+                # The client went away or its buffer is full; it will just ask again
+                logger.debug(f"Could not answer status request: {e}")
+
+    def _read_commands(self):
+        """Read pending data from the command FIFO and process each complete command."""
+        try:
+            data = os.read(self._fifo_fd, 4096)
+        except BlockingIOError:
+            return
+        
+        # Commands are newline-terminated; keep any partial line for the next read
+        self._command_buffer.extend(data)
+        *lines, rest = self._command_buffer.split(b"\n")
+        self._command_buffer = bytearray(rest)
+        
+        for raw_command in lines:
+            logger.debug(f"Raw command read from FIFO: '{raw_command.hex()}' (len: {len(raw_command)})")
+            command = raw_command.decode('utf-8', errors='replace').strip()
+            if command:
+                logger.info(f"Received command: {command}")
+                self._process_command(command)
 
     def _process_command(self, command):
         """Process a command received from the command FIFO pipe."""
-        if command == "start":
-            # Start a new work session if we're idle
-            if self.current_state == PomodoroState.IDLE:
-                self._start_work_session()
-            # Resume if paused
-            elif self.current_state == PomodoroState.PAUSED:
-                self._resume()
-        elif command == "pause":
-            if self.current_state in [PomodoroState.WORK, PomodoroState.SHORT_BREAK, PomodoroState.LONG_BREAK]:
-                self._pause()
-        elif command == "resume":
-            if self.current_state == PomodoroState.PAUSED:
-                self._resume()
-        elif command == "skip":
-            if self.current_state in [PomodoroState.WORK, PomodoroState.SHORT_BREAK, PomodoroState.LONG_BREAK]:
-                self._skip_current_phase()
-        elif command == "reset":
-            self._reset()
-        elif command == "restart_cycle":
-            self._restart_cycle()
-        elif command == "get_status":
-            self._write_status()
+        handler = self._command_handlers.get(command)
+        if handler:
+            handler()
         else:
             logger.warning(f"Unknown command: {command}")
 
-    def _write_status(self):
-        """Write the current status to the status file."""
+    def _handle_start(self):
+        """Start a new work session if we're idle, or resume if paused."""
+        if self.current_state == PomodoroState.IDLE:
+            self._start_work_session()
+        elif self.current_state == PomodoroState.PAUSED:
+            self._resume()
+
+    def _handle_pause(self):
+        """Pause the current phase if one is running."""
+        if self.current_state in [PomodoroState.WORK, PomodoroState.SHORT_BREAK, PomodoroState.LONG_BREAK]:
+            self._pause()
+
+    def _handle_resume(self):
+        """Resume the paused phase."""
+        if self.current_state == PomodoroState.PAUSED:
+            self._resume()
+
+    def _handle_skip(self):
+        """Skip the current phase if one is running."""
+        if self.current_state in [PomodoroState.WORK, PomodoroState.SHORT_BREAK, PomodoroState.LONG_BREAK]:
+            self._skip_current_phase()
+
+    def _handle_get_status(self):
+        """Rewrite the status file right away, even if nothing changed."""
+        self._write_status(force=True)
+
+    def _build_status(self):
+        """Build the current status dictionary."""
+        # Read the remaining time once so the message and the field always agree
+        time_remaining = self.time_remaining_seconds
+        minutes, seconds = divmod(time_remaining, 60)
+        time_string = f"{minutes:02d}:{seconds:02d}"
+        
+        message = ""
+        if self.current_state == PomodoroState.WORK:
+            message = f"Work: {time_string}"
+        elif self.current_state == PomodoroState.SHORT_BREAK:
+            message = f"Break: {time_string}"
+        elif self.current_state == PomodoroState.LONG_BREAK:
+            message = f"Long Break: {time_string}"
+        elif self.current_state == PomodoroState.PAUSED:
+            if self.paused_state == PomodoroState.WORK:
+                message = f"Paused Work: {time_string}"
+            elif self.paused_state == PomodoroState.SHORT_BREAK:
+                message = f"Paused Break: {time_string}"
+            elif self.paused_state == PomodoroState.LONG_BREAK:
+                message = f"Paused Long Break: {time_string}"
+        else:  # IDLE
+            message = "Ready"
+        
+        status = {
+            "state": STATE_MAP[self.current_state],
+            "time_remaining": time_remaining,
+            "pomodoros_completed": self.pomodoros_completed_in_cycle,
+            "total_pomodoros_for_long_break": self.long_break_every,
+            "message": message
+        }
+        return status
+
+    def _write_status(self, force=False):
+        """
+        Write the current status to the status file.
+        Unless forced, writes closer together than STATUS_WRITE_MIN_INTERVAL are
+        coalesced into one write that the main loop performs once the interval ends,
+        and writes whose content matches the last one are skipped.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_status_write < self.STATUS_WRITE_MIN_INTERVAL:
+            self._status_write_deadline = self._last_status_write + self.STATUS_WRITE_MIN_INTERVAL
+            return
+        self._last_status_write = now
+        self._status_write_deadline = None
+        
         try:
-            state_map = {
-                PomodoroState.IDLE: "idle",
-                PomodoroState.WORK: "work",
-                PomodoroState.SHORT_BREAK: "short_break",
-                PomodoroState.LONG_BREAK: "long_break",
-                PomodoroState.PAUSED: "paused"
-            }
-            
-            minutes, seconds = divmod(self.time_remaining_seconds, 60)
-            time_string = f"{minutes:02d}:{seconds:02d}"
-            
-            message = ""
-            if self.current_state == PomodoroState.WORK:
-                message = f"Work: {time_string}"
-            elif self.current_state == PomodoroState.SHORT_BREAK:
-                message = f"Break: {time_string}"
-            elif self.current_state == PomodoroState.LONG_BREAK:
-                message = f"Long Break: {time_string}"
-            elif self.current_state == PomodoroState.PAUSED:
-                if self.paused_state == PomodoroState.WORK:
-                    message = f"Paused Work: {time_string}"
-                elif self.paused_state == PomodoroState.SHORT_BREAK:
-                    message = f"Paused Break: {time_string}"
-                elif self.paused_state == PomodoroState.LONG_BREAK:
-                    message = f"Paused Long Break: {time_string}"
-            else:  # IDLE
-                message = "Ready"
-            
-            status = {
-                "state": state_map[self.current_state],
-                "time_remaining": self.time_remaining_seconds,
-                "pomodoros_completed": self.pomodoros_completed_in_cycle,
-                "total_pomodoros_for_long_break": self.config["pomodoros_before_long_break"],
-                "message": message
-            }
+            self._ensure_status_file()
+            status = self._build_status()
+
+            # Prepare the serialized JSON payload
+            payload = _dumps(status)
+
+            # Skip the write if nothing changed since the last one
+            if not force and payload == self._last_status_payload:
+                return
+
+            # Overwrite in place with a single pwrite. Padding with spaces up to the
+            # longest payload so far means the file never shrinks, so readers never
+            # see an empty file or leftover bytes; JSON parsers ignore the padding.
+            self._status_file_size = max(self._status_file_size, len(payload))
+            os.pwrite(self._status_fd, payload.ljust(self._status_file_size), 0)
             
-            # Prepare the full JSON string
-            status_json_string = json.dumps(status)
-            with open(self.status_file_path, 'w') as f:
-                f.write(status_json_string)
-            # logger.debug(f"Status written to {self.status_file_path}: {status_json_string}")
+            # Only remember the payload once it's on disk, so a failed write is retried
+            self._last_status_payload = payload
+            # logger.debug(f"Status written to {self.status_file_path}: {payload}")
         except Exception as e:
             # Unexpected errors during status write
             logger.error(f"Unexpected error writing status to {self.status_file_path}: {e}")
 
     def _start_work_session(self):
         """Start a new work session."""
+        self.phase_deadline = time.monotonic() + self.work_seconds
+        self._schedule_status_refresh()
         self.current_state = PomodoroState.WORK
-        self.time_remaining_seconds = self.config["work_duration_minutes"] * 60
         self.session_start_timestamp = int(time.time())
-        self._write_status()
+        self._session_monotonic_start = time.monotonic_ns()
+        self._write_status(force=True)
         logger.info("Started work session")
         
     def _start_break(self, is_long_break=False):
         """Start a break session."""
         if is_long_break:
+            self.phase_deadline = time.monotonic() + self.long_break_seconds
+            self._schedule_status_refresh()
             self.current_state = PomodoroState.LONG_BREAK
-            self.time_remaining_seconds = self.config["long_break_duration_minutes"] * 60
             logger.info("Started long break")
         else:
+            self.phase_deadline = time.monotonic() + self.short_break_seconds
+            self._schedule_status_refresh()
             self.current_state = PomodoroState.SHORT_BREAK
-            self.time_remaining_seconds = self.config["short_break_duration_minutes"] * 60
             logger.info("Started short break")
         
         self.session_start_timestamp = int(time.time())
-        self._write_status()
+        self._session_monotonic_start = time.monotonic_ns()
+        self._write_status(force=True)
         
     def _pause(self):
         """Pause the current session."""
@@ -304,9 +490,11 @@ class PomodoroTimer:
     def _resume(self):
         """Resume a paused session."""
         if self.current_state == PomodoroState.PAUSED:
+            self.phase_deadline = time.monotonic() + self.paused_time_remaining
+            self._schedule_status_refresh()
             self.current_state = self.paused_state
-            self.time_remaining_seconds = self.paused_time_remaining
             self.session_start_timestamp = int(time.time())
+            self._session_monotonic_start = time.monotonic_ns()
             self._write_status()
             logger.info("Resumed session")
             
@@ -330,9 +518,9 @@ class PomodoroTimer:
             self._log_session(completed=False)
             
         self.current_state = PomodoroState.IDLE
-        self.time_remaining_seconds = 0
+        self.phase_deadline = None
         self.session_start_timestamp = None
-        self._write_status()
+        self._write_status(force=True)
         logger.info("Reset timer")
             
     def _restart_cycle(self):
@@ -350,8 +538,9 @@ class PomodoroTimer:
         if self.session_start_timestamp is None:
             return
         
+        # Measure on the monotonic clock so wall-clock jumps can't skew the duration
+        duration = (time.monotonic_ns() - self._session_monotonic_start) // 1_000_000_000
         end_time = int(time.time())
-        duration = end_time - self.session_start_timestamp
         
         # Map state to type
         type_map = {
@@ -366,16 +555,13 @@ class PomodoroTimer:
         if state in type_map:
             session_type = type_map[state]
             
-            db_path = os.path.expanduser(self.config["db_path"])
-            conn = None
+            began_transaction = False
             try:
-                conn = sqlite3.connect(db_path)
-                cursor = conn.cursor()
-                cursor.execute('''
-                INSERT INTO sessions 
-                (start_time, end_time, type, completed, duration_actual_seconds, pomodoro_count_at_completion)
-                VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
+                # Open a write transaction unless an earlier log's commit is still pending
+                if not self.db_conn.in_transaction:
+                    self.db_conn.execute("BEGIN IMMEDIATE")
+                    began_transaction = True
+                self.db_conn.execute(self.INSERT_SESSION_SQL, (
                     self.session_start_timestamp,
                     end_time,
                     session_type,
@@ -383,13 +569,27 @@ class PomodoroTimer:
                     duration,
                     self.pomodoros_completed_in_cycle
                 ))
-                conn.commit()
+                
+                # Defer the commit to the main loop; another log within the delay pushes it back
+                self._commit_deadline = time.monotonic() + self.COMMIT_DELAY_SECONDS
                 logger.info(f"Logged {session_type} session: {duration} seconds, completed: {completed}")
             except Exception as e:
                 logger.error(f"Error logging session: {e}")
-            finally:
-                if conn:
-                    conn.close()
+                # Don't leave the write lock held by a transaction nobody will commit
+                if began_transaction and self.db_conn.in_transaction:
+                    try:
+                        self.db_conn.execute("ROLLBACK")
+                    except Exception as rollback_error:
+                        logger.error(f"Error rolling back session log: {rollback_error}")
+
+    def _flush_db(self):
+        """Commit any session logs still pending in the current transaction."""
+        self._commit_deadline = None
+        try:
+            if self.db_conn.in_transaction:
+                self.db_conn.execute("COMMIT")
+        except Exception as e:
+            logger.error(f"Error committing sessions: {e}")
 
     def _complete_work_session(self, was_skipped=False):
         """Handle completion of a work session."""
@@ -402,11 +602,11 @@ class PomodoroTimer:
         self._send_notification("Pomodoro completed!", "Time for a break!")
         
         # Play sound if configured
-        if self.config["notification_sound_work_end"]:
-            self._play_sound(self.config["notification_sound_work_end"])
+        if self.sound_work_end_expanded:
+            self._play_sound(self.sound_work_end_expanded)
         
         # Determine which break to take
-        if self.pomodoros_completed_in_cycle % self.config["pomodoros_before_long_break"] == 0:
+        if self.pomodoros_completed_in_cycle % self.long_break_every == 0:
             self._start_break(is_long_break=True)
         else:
             self._start_break(is_long_break=False)
@@ -419,68 +619,142 @@ class PomodoroTimer:
         self._send_notification("Break completed!", "Time to focus!")
         
         # Play sound if configured
-        if self.config["notification_sound_break_end"]:
-            self._play_sound(self.config["notification_sound_break_end"])
+        if self.sound_break_end_expanded:
+            self._play_sound(self.sound_break_end_expanded)
         
         # Start a new work session
         self._start_work_session()
             
+    def _spawn(self, cmd):
+        """Start a helper process in the background without waiting for it."""
+        subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+
     def _send_notification(self, title, body):
         """Send a desktop notification."""
         try:
-            subprocess.run(["notify-send", title, body])
+            self._spawn(["notify-send", title, body])
             logger.info(f"Notification sent: {title}")
         except Exception as e:
             logger.error(f"Error sending notification: {e}")
             
     def _play_sound(self, sound_path):
-        """Play a notification sound."""
+        """Play a notification sound (the path is expanded and checked at startup)."""
         try:
-            sound_path = os.path.expanduser(sound_path)
-            if os.path.exists(sound_path):
-                subprocess.run(["aplay", sound_path])
-                logger.info(f"Played sound: {sound_path}")
+            self._spawn(["aplay", sound_path])
+            logger.info(f"Played sound: {sound_path}")
         except Exception as e:
             logger.error(f"Error playing sound: {e}")
             
     def _handle_exit(self, signum, frame):
-        """Handle exit signals gracefully."""
+        """Handle exit signals by waking the main loop so it can shut down."""
         logger.info(f"Received signal {signum}, shutting down...")
-        
+        self.running = False
+        os.write(self._shutdown_w, b"x")
+
+    def _shutdown(self):
+        """Log any running session and release resources."""
         # If we're in the middle of a session, log it as incomplete
         if self.current_state not in [PomodoroState.IDLE, PomodoroState.PAUSED]:
             self._log_session(completed=False)
-            
-        self.running = False
+        
+        # Commit pending session logs now instead of waiting for the deadline
+        self._flush_db()
         self.db_conn.close()
-        sys.exit(0)
-            
+        
+        os.close(self._fifo_fd)
+        os.close(self._fifo_keepalive)
+        os.close(self._status_fd)
+        
+        if self.status_socket:
+            self.status_socket.close()
+            try:
+                os.unlink(self.status_socket_path)
+            except OSError:
+                pass
+
+    def _schedule_status_refresh(self):
+        """
+        Schedule the next periodic status write for when the remaining time
+        reaches the next multiple of 5 seconds (never later than the deadline).
+        """
+        now = time.monotonic()
+        step = (self.phase_deadline - now) % 5
+        if step < 0.05:
+            step += 5
+        self._next_status_refresh = min(now + step, self.phase_deadline)
+
+    def _next_timeout(self):
+        """
+        Seconds until the main loop next has timed work to do, or None to wait
+        for I/O only. Active phases wake when the remaining time hits the next
+        multiple of 5 seconds (to refresh the status) or the deadline.
+        """
+        now = time.monotonic()
+        timeouts = []
+        if self.current_state not in [PomodoroState.IDLE, PomodoroState.PAUSED]:
+            timeouts.append(max(0, min(self.phase_deadline, self._next_status_refresh) - now))
+        if self._commit_deadline is not None:
+            timeouts.append(max(0, self._commit_deadline - now))
+        if self._status_write_deadline is not None:
+            timeouts.append(max(0, self._status_write_deadline - now))
+        return min(timeouts) if timeouts else None
+
+    def _handle_timers(self):
+        """Run phase transitions, status refreshes and deferred commits/writes that are due."""
+        now = time.monotonic()
+        
+        # Don't do anything if idle or paused
+        if self.current_state not in [PomodoroState.IDLE, PomodoroState.PAUSED]:
+            if self.phase_deadline > now:
+                # Other wakeups (commands, status requests) don't rewrite the file
+                if self._next_status_refresh <= now:
+                    self._write_status()
+                    self._schedule_status_refresh()
+            # Time's up! Handle the transition
+            elif self.current_state == PomodoroState.WORK:
+                self._complete_work_session()
+            else:
+                self._complete_break_session()
+        
+        if self._commit_deadline is not None and self._commit_deadline <= now:
+            self._flush_db()
+        
+        if self._status_write_deadline is not None and self._status_write_deadline <= now:
+            self._write_status()
+
     def run(self):
-        """Run the main timer loop."""
+        """
+        Run the main event loop.
+        Commands, status requests and timers are all handled from a single
+        select() call, whose timeout is derived from the phase deadline.
+        """
         logger.info("Starting main timer loop")
         
+        watched = [self._fifo_fd, self._shutdown_r]
+        if self.status_socket:
+            watched.append(self.status_socket)
+        
         while self.running:
             try:
-                # Don't do anything if idle or paused
-                if self.current_state not in [PomodoroState.IDLE, PomodoroState.PAUSED]:
-                    # Decrement the time remaining
-                    if self.time_remaining_seconds > 0:
-                        self.time_remaining_seconds -= 1
-                        
-                        # Write status every 5 seconds
-                        if self.time_remaining_seconds % 5 == 0:
-                            self._write_status()
-                    else:
-                        # Time's up! Handle the transition
-                        if self.current_state == PomodoroState.WORK:
-                            self._complete_work_session()
-                        elif self.current_state in [PomodoroState.SHORT_BREAK, PomodoroState.LONG_BREAK]:
-                            self._complete_break_session()
-                
-                time.sleep(1)
+                readable, _, _ = select.select(watched, [], [], self._next_timeout())
+                if self._shutdown_r in readable:
+                    break
+                if self._fifo_fd in readable:
+                    self._read_commands()
+                if self.status_socket in readable:
+                    self._answer_status_request()
+                self._handle_timers()
             except Exception as e:
                 logger.error(f"Error in main loop: {e}")
                 time.sleep(1)  # Wait a bit before continuing
+        
+        self._shutdown()
 
 
 def main():
@@ -1,16 +1,26 @@
 #!/usr/bin/env python3
 """
 Tomatobar Module
-This script reads the Tomatobar timer status from a FIFO pipe and formats it for Waybar.
+This script reads the Tomatobar timer status from the backend's status socket
+(falling back to the status file) and formats it for Waybar.
 It also provides command-line functionality to send commands to the backend.
 """
 
 import argparse
 import json
 import os
+import socket
 import sys
 import time
 
+# orjson is optional; fall back to compact stdlib JSON. Both return bytes.
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+
 
 def get_config_path():
     """Get the config file path, either from user's config dir or the project dir."""
@@ -49,39 +59,56 @@ def load_config():
         sys.exit(1)
 
 
+# Emoji for each state
+_EMOJI = {
+    "idle": "🍅",
+    "work": "🍅",
+    "short_break": "☕",
+    "long_break": "🌴",
+    "paused": "⏸️"
+}
+
+# Shorter text for when space is limited; it only depends on the state
+_ALT = {state: f"{emoji} {state.capitalize()}" for state, emoji in _EMOJI.items()}
+
+
 def format_status_for_waybar(status):
     """Format the status JSON for Waybar."""
     state = status["state"]
-    pomodoros_completed = status["pomodoros_completed"]
-    total_pomodoros = status["total_pomodoros_for_long_break"]
-    message = status["message"]
-    
-    # Emoji for each state
-    emoji_map = {
-        "idle": "🍅",
-        "work": "🍅",
-        "short_break": "☕",
-        "long_break": "🌴",
-        "paused": "⏸️"
-    }
-    
-    emoji = emoji_map.get(state, "🍅")
-    
-    # Text to display
-    text = f"{emoji} {message} [{pomodoros_completed}/{total_pomodoros}]"
-    
-    # Shorter text for when space is limited
-    alt = f"{emoji} {state.capitalize()}"
+    emoji = _EMOJI.get(state, "🍅")
     
     return {
-        "text": text,
-        "alt": alt,
+        "text": f"{emoji} {status['message']} [{status['pomodoros_completed']}/{status['total_pomodoros_for_long_break']}]",
+        "alt": _ALT.get(state) or f"{emoji} {state.capitalize()}",
         "class": state
     }
 
 
+def query_status_socket(socket_path):
+    """
+    Ask the backend for its status over the status socket.
+    Returns the status dictionary, or None if the backend could not be reached.
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            # Autobind to an abstract address so the backend can reply to us
+            sock.bind("")
+            sock.settimeout(0.5)
+            sock.connect(socket_path)
+            sock.send(b"?")
+            return json.loads(sock.recv(4096))
+    except (OSError, ValueError):
+        return None
+
+
 def read_status(config):
-    """Read the current status from the status file."""
+    """Read the current status from the status socket, or the status file as a fallback."""
+    socket_path = config.get("status_socket_path")
+    if socket_path and os.path.exists(socket_path):
+        status = query_status_socket(socket_path)
+        if status is not None:
+            return format_status_for_waybar(status)
+
     status_file_path = config.get("status_file_path") # Use .get for safety
     
     if not status_file_path:
@@ -144,13 +171,57 @@ def send_command(config, command):
         sys.exit(1)
 
 
+def write_waybar_line(status):
+    """Write one Waybar JSON line to stdout."""
+    sys.stdout.buffer.write(_dumps(status) + b"\n")
+    sys.stdout.flush()
+
+
+def run_daemon():
+    """
+    Print one status line per second for Waybar's continuous exec mode.
+    The config is loaded once and only re-read when the resolved config path
+    or its mtime changes (e.g. when a user config is created later).
+    """
+    config = load_config()
+    config_path = get_config_path()
+    config_mtime = os.path.getmtime(config_path)
+    
+    try:
+        while True:
+            path = get_config_path() or config_path
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                path, mtime = config_path, config_mtime
+            if path != config_path or mtime != config_mtime:
+                config_path, config_mtime = path, mtime
+                try:
+                    with open(config_path, 'r') as f:
+                        config = json.load(f)
+                except Exception:
+                    pass  # Keep the previous config until the file is valid again
+            
+            write_waybar_line(read_status(config))
+            time.sleep(1)
+    except (BrokenPipeError, KeyboardInterrupt):
+        # Waybar closed our stdout or we were interrupted
+        sys.exit(0)
+
+
 def main():
     """Main entry point for the Waybar module script."""
     parser = argparse.ArgumentParser(description='Tomatobar Module')
     parser.add_argument('--action', choices=['start', 'pause', 'resume', 'skip', 'reset', 'restart_cycle'],
                       help='Action to perform')
+    parser.add_argument('--daemon', action='store_true',
+                      help='Keep running and print a status line every second')
     
     args = parser.parse_args()
+    
+    if args.daemon and not args.action:
+        run_daemon()
+    
     config = load_config()
     
     # If an action was specified, send the command and exit
@@ -159,8 +230,7 @@ def main():
         sys.exit(0)
     
     # Otherwise, read and display the status
-    status = read_status(config)
-    print(json.dumps(status), flush=True)
+    write_waybar_line(read_status(config))
 
 
 if __name__ == "__main__":